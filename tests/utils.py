@@ -1,4 +1,5 @@
 import asyncio
+import functools
 import logging
 import os
 
@@ -89,6 +90,7 @@ def dummy_dtls_transport_pair():
     return (dtls_a, dtls_b)
 
 
+@functools.lru_cache(maxsize=None)
 def load(name: str) -> bytes:
     path = os.path.join(os.path.dirname(__file__), name)
     with open(path, "rb") as fp: